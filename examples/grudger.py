@@ -18,29 +18,45 @@ Weak against: Tit-for-Tat with occasional mistakes
 """
 import sys
 
+COOPERATE = sys.intern("COOPERATE")
+DEFECT = sys.intern("DEFECT")
+
+# Moves are encoded as ints so the strategy itself is a pure function
+MOVE_COOPERATE = 0
+MOVE_DEFECT = 1
+
+# Pre-encoded replies written straight to the binary stdout buffer,
+# indexed by move.
+REPLIES = (b"COOPERATE\n", b"DEFECT\n")
 
-def main():
-    betrayed = False
 
-    while True:
-        try:
-            line = input().strip()
+def parse_move(line):
+    """Encode an opponent move; anything but DEFECT counts as cooperation."""
+    if line == DEFECT:
+        return MOVE_DEFECT
+    if not line or line == COOPERATE:
+        return MOVE_COOPERATE
+    # The judge sends moves in upper case; normalise only unexpected input
+    return MOVE_DEFECT if line.upper() == DEFECT else MOVE_COOPERATE
 
-            # Check if opponent ever defected
-            if line.upper() == "DEFECT":
-                betrayed = True
 
-            # Cooperate until betrayed, then defect forever
-            if betrayed:
-                my_move = "DEFECT"
-            else:
-                my_move = "COOPERATE"
+def decide(opponent_move, grudge):
+    """Return our move: defect forever once the opponent has defected."""
+    return grudge | opponent_move
+
+
+def main():
+    grudge = MOVE_COOPERATE
+    out = sys.stdout.buffer
 
-            print(my_move)
-            sys.stdout.flush()
+    # Iterating stdin ends the loop cleanly on EOF
+    for line in sys.stdin:
+        # Cooperate until betrayed, then defect forever
+        grudge = decide(parse_move(line.strip()), grudge)
 
-        except EOFError:
-            break
+        # The judge waits for each move, so flush every round
+        out.write(REPLIES[grudge])
+        out.flush()
 
 
 if __name__ == "__main__":
@@ -15,32 +15,49 @@ This strategy is:
 """
 import sys
 
+COOPERATE = sys.intern("COOPERATE")
+DEFECT = sys.intern("DEFECT")
+
+# Moves are encoded as ints so the strategy itself is a pure function
+MOVE_COOPERATE = 0
+MOVE_DEFECT = 1
+
+# Pre-encoded replies written straight to the binary stdout buffer,
+# indexed by move.
+REPLIES = (b"COOPERATE\n", b"DEFECT\n")
+
+
+def parse_move(line):
+    """Encode an opponent move; anything but DEFECT counts as cooperation."""
+    if line == DEFECT:
+        return MOVE_DEFECT
+    if not line or line == COOPERATE:
+        return MOVE_COOPERATE
+    # The judge sends moves in upper case; normalise only unexpected input
+    return MOVE_DEFECT if line.upper() == DEFECT else MOVE_COOPERATE
+
+
+def decide(opponent_move):
+    """Return our move given the opponent's previous move."""
+    return opponent_move
+
 
 def main():
-    opponent_last_move = None
-
-    while True:
-        try:
-            line = input().strip()
-
-            # Parse opponent's move (empty on first round)
-            if line:
-                opponent_last_move = line.upper()
-
-            # First move: always cooperate
-            # After that: copy opponent's last move
-            if opponent_last_move is None:
-                my_move = "COOPERATE"
-            elif opponent_last_move == "DEFECT":
-                my_move = "DEFECT"
-            else:
-                my_move = "COOPERATE"
-
-            print(my_move)
-            sys.stdout.flush()
-
-        except EOFError:
-            break
+    # First move: always cooperate
+    opponent_move = MOVE_COOPERATE
+    out = sys.stdout.buffer
+
+    # Iterating stdin ends the loop cleanly on EOF
+    for line in sys.stdin:
+        line = line.strip()
+
+        # Parse opponent's move (empty on first round)
+        if line:
+            opponent_move = parse_move(line)
+
+        # The judge waits for each move, so flush every round
+        out.write(REPLIES[decide(opponent_move)])
+        out.flush()
 
 
 if __name__ == "__main__":